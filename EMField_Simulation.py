@@ -20,15 +20,187 @@ Aim:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from scipy.integrate import odeint
+from numba import njit
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget
 from PyQt5.QtWidgets import QSizePolicy, QVBoxLayout
+from PyQt5.QtCore import QTimer
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 
 
+@njit(fastmath=True, cache=True, nogil=True, inline='always')
+def scaled_field_at(q, posx, posy, x, y):
+    ''' scaled electric field components at position x, y
+
+    Same field and scaling as Charges.scaled_electric_field but written as
+    a tight loop over the charges so numba can compile it without any
+    temporary arrays. The charge coordinates arrive as separate x and y
+    arrays so the loop reads each with unit stride.
+
+    Parameters
+    ----------
+    q: contiguous 1-d float64 array
+        values of the charges
+
+    posx, posy: contiguous 1-d float64 arrays
+        x and y positions of the charges
+
+    x, y: float
+        position at which the scaled field is requested
+
+    Returns
+    -------
+    ex, ey: tuple of floats
+        the components of the scaled electric field
+    '''
+    ex = 0.0
+    ey = 0.0
+    for k in range(q.shape[0]):
+        rx = x - posx[k]
+        ry = y - posy[k]
+        dsq = rx*rx + ry*ry
+        emag = q[k]/(dsq*np.sqrt(dsq))
+        ex += emag*rx
+        ey += emag*ry
+    s = ex*ex + ey*ey
+    return ex/(s + 0.0001), ey/(s + 0.0001)
+
+
+@njit(cache=True)
+def closest_charge(posx, posy, x, y):
+    ''' index of and squared distance to the charge closest to x, y
+
+    A plain loop over the charges: for the handful of charges the GUI
+    deals with this beats building the temporary difference arrays the
+    NumPy formulation needs on every mouse event.
+
+    Parameters
+    ----------
+    posx, posy: contiguous 1-d float64 arrays
+        x and y positions of the charges
+
+    x, y: float
+        position to find the closest charge to
+
+    Returns
+    -------
+    kmin, dmin: tuple of int and float
+        index of the closest charge and its squared distance;
+        kmin is -1 if there are no charges
+    '''
+    kmin = -1
+    dmin = np.inf
+    for k in range(posx.shape[0]):
+        dx = x - posx[k]
+        dy = y - posy[k]
+        d = dx*dx + dy*dy
+        if d < dmin:
+            dmin = d
+            kmin = k
+    return kmin, dmin
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def rk45_fieldline(q, posx, posy, xy0, lambdas, out, rtol, atol):
+    ''' integrate a single field line with an adaptive RK45 scheme
+
+    Replaces the odeint call in Charges.field_lines: the right hand side
+    is so cheap that odeint spends nearly all its time crossing the
+    Python/C boundary, while a compiled integrator runs entirely in
+    machine code. The embedded Cash-Karp 4(5) pair subdivides each output
+    interval until the local error estimate meets the tolerances, so the
+    steep field close to a charge is resolved without oversampling the
+    smooth regions. A line that comes within 0.1 of a negative charge has
+    converged on a sink and is frozen there.
+
+    Parameters
+    ----------
+    q: contiguous 1-d float64 array
+        values of the charges
+
+    posx, posy: contiguous 1-d float64 arrays
+        x and y positions of the charges
+
+    xy0: 1-d float64 array
+        x,y pair the field line starts from
+
+    lambdas: 1-d float64 array
+        values of the line parameter at which points are recorded
+
+    out: 2-d float64 array of shape (len(lambdas), 2)
+        filled with the x and y values of the field line
+
+    rtol, atol: float
+        relative and absolute tolerance of the local error control
+    '''
+    x = xy0[0]
+    y = xy0[1]
+    out[0, 0] = x
+    out[0, 1] = y
+    for i in range(1, lambdas.shape[0]):
+        t = lambdas[i-1]
+        t_end = lambdas[i]
+        h = t_end - t
+        while t < t_end:
+            if t + h > t_end:
+                h = t_end - t
+            k1x, k1y = scaled_field_at(q, posx, posy, x, y)
+            k2x, k2y = scaled_field_at(q, posx, posy,
+                                       x + h*(k1x/5),
+                                       y + h*(k1y/5))
+            k3x, k3y = scaled_field_at(q, posx, posy,
+                                       x + h*(3*k1x/40 + 9*k2x/40),
+                                       y + h*(3*k1y/40 + 9*k2y/40))
+            k4x, k4y = scaled_field_at(q, posx, posy,
+                                       x + h*(3*k1x/10 - 9*k2x/10 + 6*k3x/5),
+                                       y + h*(3*k1y/10 - 9*k2y/10 + 6*k3y/5))
+            k5x, k5y = scaled_field_at(q, posx, posy,
+                                       x + h*(-11*k1x/54 + 5*k2x/2 - 70*k3x/27 + 35*k4x/27),
+                                       y + h*(-11*k1y/54 + 5*k2y/2 - 70*k3y/27 + 35*k4y/27))
+            k6x, k6y = scaled_field_at(q, posx, posy,
+                                       x + h*(1631*k1x/55296 + 175*k2x/512 + 575*k3x/13824
+                                              + 44275*k4x/110592 + 253*k5x/4096),
+                                       y + h*(1631*k1y/55296 + 175*k2y/512 + 575*k3y/13824
+                                              + 44275*k4y/110592 + 253*k5y/4096))
+            # 5th order solution and embedded 4th order error estimate
+            x5 = x + h*(37*k1x/378 + 250*k3x/621 + 125*k4x/594 + 512*k6x/1771)
+            y5 = y + h*(37*k1y/378 + 250*k3y/621 + 125*k4y/594 + 512*k6y/1771)
+            errx = h*((37/378 - 2825/27648)*k1x + (250/621 - 18575/48384)*k3x
+                      + (125/594 - 13525/55296)*k4x - (277/14336)*k5x
+                      + (512/1771 - 1/4)*k6x)
+            erry = h*((37/378 - 2825/27648)*k1y + (250/621 - 18575/48384)*k3y
+                      + (125/594 - 13525/55296)*k4y - (277/14336)*k5y
+                      + (512/1771 - 1/4)*k6y)
+            scale_x = atol + rtol*max(abs(x), abs(x5))
+            scale_y = atol + rtol*max(abs(y), abs(y5))
+            err = max(abs(errx)/scale_x, abs(erry)/scale_y)
+            if err <= 1.0 or h <= 1e-12:
+                t += h
+                x = x5
+                y = y5
+                if err > 1e-10:
+                    h *= min(5.0, 0.9*err**-0.2)
+                else:
+                    h *= 5.0
+            else:
+                h *= max(0.1, 0.9*err**-0.25)
+        out[i, 0] = x
+        out[i, 1] = y
+        # freeze the line once it has converged on a negative charge
+        for k in range(q.shape[0]):
+            if q[k] < 0:
+                dx = x - posx[k]
+                dy = y - posy[k]
+                if dx*dx + dy*dy < 0.1**2:
+                    for j in range(i + 1, lambdas.shape[0]):
+                        out[j, 0] = x
+                        out[j, 1] = y
+                    return
+
+
 class Charges:
     ''' A collection of point charges in the xy-plane
 
@@ -43,34 +215,95 @@ class Charges:
 
     def __init__(self):
         # private attributes
-        # self._q is a 1d array holding the value of the charge for the different charges
-        # charege n has a charge of self._q[n]
-        self._q = np.zeros((0, ))
-        # self._pos is a 2d array with xy coordinates of the charges
-        # x position of charge n is self._pos[n, 0]
-        # y position of charge n is self._pos[n, 1]
-        self._pos = np.zeros((0, 2))
+        # the charges live in capacity-backed buffers so adding a charge
+        # does not copy the whole arrays; self._n is the number of charges
+        # actually in use and self._q / self._pos are views onto the buffers
+        self._n = 0
+        self._q_buf = np.empty((4, ))
+        # x and y coordinates are kept in separate arrays so the field
+        # kernels get contiguous unit-stride loads of each component
+        self._posx_buf = np.empty((4, ))
+        self._posy_buf = np.empty((4, ))
+        # cached field lines, keyed by (index of originating charge, args)
+        self._fieldline_cache = {}
+        # cached start-point offsets, keyed by (nr_of_fieldlines, start_radius)
+        self._offsets_cache = {}
+        # worker threads for tracing independent field lines in parallel,
+        # created on first use
+        self._pool = None
+
+    @property
+    def _q(self):
+        ''' 1d array view holding the value of the charge for the different charges
+            charge n has a charge of self._q[n] '''
+        return self._q_buf[:self._n]
+
+    @property
+    def _posx(self):
+        ''' 1d array view with the x coordinates of the charges '''
+        return self._posx_buf[:self._n]
+
+    @property
+    def _posy(self):
+        ''' 1d array view with the y coordinates of the charges '''
+        return self._posy_buf[:self._n]
 
     def add_charge(self, q, xy):
         ''' add charge of magnitude q at locations x,y = xy '''
-        self._q = np.hstack([self._q, q])
-        self._pos = np.vstack([self._pos, np.array([xy])])
+        if self._n == self._q_buf.shape[0]:
+            # grow by doubling for O(1) amortized insertion
+            cap = 2*self._q_buf.shape[0]
+            self._q_buf = np.resize(self._q_buf, (cap, ))
+            self._posx_buf = np.resize(self._posx_buf, (cap, ))
+            self._posy_buf = np.resize(self._posy_buf, (cap, ))
+        self._q_buf[self._n] = q
+        self._posx_buf[self._n] = xy[0]
+        self._posy_buf[self._n] = xy[1]
+        self._n += 1
+        self._fieldline_cache.clear()
 
     def delete_charge(self, k):
         ''' delete charge k '''
-        if k >= 0 and k < self._q.shape[0]:
-            self._q = np.delete(self._q, k)
-            self._pos = np.delete(self._pos, k, 0)
+        if k >= 0 and k < self._n:
+            # overwrite with the last charge instead of shifting everything;
+            # the order of the charges is not semantically important
+            self._q_buf[k] = self._q_buf[self._n - 1]
+            self._posx_buf[k] = self._posx_buf[self._n - 1]
+            self._posy_buf[k] = self._posy_buf[self._n - 1]
+            self._n -= 1
+            self._fieldline_cache.clear()
 
     def set_position(self, k, xy):
         ''' set position of charge k to xy '''
-        if k >= 0 and k < self._q.shape[0]:
-            self._pos[k, :] = xy
+        if k >= 0 and k < self._n:
+            old_xy = np.array([self._posx_buf[k], self._posy_buf[k]])
+            self._posx_buf[k] = xy[0]
+            self._posy_buf[k] = xy[1]
+            self._invalidate_fieldlines(k, old_xy, np.asarray(xy, dtype=float))
+
+    def _invalidate_fieldlines(self, k, old_xy, new_xy, radius=1.0):
+        ''' drop cached field lines that moving charge k can have changed
+
+        A cached entry is kept only if it neither originates from charge k
+        nor passes within radius of the old or the new position of the
+        charge; far-away lines barely move during a drag so their cached
+        arrays are reused.
+        '''
+        for key in list(self._fieldline_cache):
+            if key[0] == k:
+                del self._fieldline_cache[key]
+                continue
+            pts = np.concatenate(self._fieldline_cache[key])
+            near_old = np.min(np.sum((pts - old_xy)**2, axis=1)) < radius**2
+            near_new = np.min(np.sum((pts - new_xy)**2, axis=1)) < radius**2
+            if near_old or near_new:
+                del self._fieldline_cache[key]
 
     def get_charges(self):
         ''' provide list of (charge, position) tuples '''
-        p = self._pos
-        return [(q, p[k, :]) for k, q in enumerate(self._q)]
+        x = self._posx
+        y = self._posy
+        return [(q, np.array([x[k], y[k]])) for k, q in enumerate(self._q)]
 
     def get_closest(self, xy, limit=0.1):
         ''' determine the index of the closest charge
@@ -91,11 +324,9 @@ class Charges:
         '''
         
         
-        r = xy - self._pos
-        d = np.sum(r**2, axis=1)
         # Index of closest charge
-        qidx = np.argmin(d)
-        if d[qidx] < limit**2:
+        qidx, dsq = closest_charge(self._posx, self._posy, xy[0], xy[1])
+        if qidx >= 0 and dsq < limit**2:
             return qidx
         return None
        
@@ -128,21 +359,112 @@ class Charges:
             scaled electric field Es = (s*Ex, s*Ey) at position xy
 
         '''
-        
-        r = xy - self._pos
-        dsq= np.sum(r**2, axis=1)
-        # Magnitude of e field
-        emag = (self._q)/dsq
-        # Unit vector
-        eunit = r.T/np.sqrt(dsq)
-        e = emag*eunit
-        etot = np.sum(e, axis=1)
-        s = etot[0]**2 + etot [1]**2
-        return etot/(s+0.0001)
+
+        # the fused kernel does the whole reduction in one pass without
+        # any of the intermediate arrays the NumPy formulation needs
+        ex, ey = scaled_field_at(self._q, self._posx, self._posy, xy[0], xy[1])
+        return np.array([ex, ey])
         
         
         
 
+    def _start_offsets(self, nr_of_fieldlines, start_radius):
+        ''' xy offsets of the field line start points around a charge
+
+        The offsets only depend on nr_of_fieldlines and start_radius, so
+        they are computed once per combination and cached.
+
+        Parameters
+        ----------
+        nr_of_fieldlines: int
+            number of field lines originating from each positive charge
+
+        start_radius: float
+            radius around each positive charge at which the field lines start
+
+        Returns
+        -------
+        dx, dy: tuple of 1-d arrays
+            offsets of the start points relative to the charge position
+        '''
+        key = (nr_of_fieldlines, start_radius)
+        if key not in self._offsets_cache:
+            ang_scale = (2*np.pi)/nr_of_fieldlines
+            # Angles for the fieldlines
+            angles = np.linspace(ang_scale, 2*np.pi, nr_of_fieldlines) + np.pi/nr_of_fieldlines
+            self._offsets_cache[key] = (start_radius*np.cos(angles),
+                                        start_radius*np.sin(angles))
+        return self._offsets_cache[key]
+
+    def _scaled_field_packet(self, xy):
+        ''' scaled electric field for a packet of positions at once
+
+        Parameters
+        ----------
+        xy: 2-d array of shape (P, 2)
+            positions at which the scaled field is requested
+
+        Returns
+        -------
+        ef: 2-d array of shape (P, 2)
+            scaled electric field at each of the P positions
+        '''
+        # (P, N) separations of every packet point from every charge
+        rx = xy[:, 0, None] - self._posx[None, :]
+        ry = xy[:, 1, None] - self._posy[None, :]
+        dsq = rx*rx + ry*ry
+        emag = self._q/(dsq*np.sqrt(dsq))
+        ex = np.sum(emag*rx, axis=1)
+        ey = np.sum(emag*ry, axis=1)
+        s = ex*ex + ey*ey + 0.0001
+        return np.stack((ex/s, ey/s), axis=1)
+
+    def field_lines_packet(self, starts, lambdas):
+        ''' trace a packet of field lines in lockstep
+
+        All P lines are advanced together with a fixed-step RK4 scheme so
+        each right hand side evaluation is a single broadcast over all
+        lines rather than P separate O(N) sums. A line that comes within
+        0.1 of a negative charge has converged on a sink and is frozen
+        there; the remaining points repeat its final position.
+
+        Parameters
+        ----------
+        starts: 2-d array of shape (P, 2)
+            x,y start points of the field lines
+
+        lambdas: 1-d array
+            values of the line parameter at which points are recorded
+
+        Returns
+        -------
+        fieldlines: 3-d array of shape (len(lambdas), P, 2)
+            fieldlines[:, p, :] is the p-th field line
+        '''
+        out = np.empty((lambdas.shape[0], starts.shape[0], 2))
+        xy = np.array(starts, dtype=float)
+        negative = self._q < 0
+        negx = self._posx[negative]
+        negy = self._posy[negative]
+        active = np.ones(starts.shape[0], dtype=bool)
+        out[0] = xy
+        for i in range(1, lambdas.shape[0]):
+            if active.any():
+                h = lambdas[i] - lambdas[i-1]
+                sub = xy[active]
+                k1 = self._scaled_field_packet(sub)
+                k2 = self._scaled_field_packet(sub + 0.5*h*k1)
+                k3 = self._scaled_field_packet(sub + 0.5*h*k2)
+                k4 = self._scaled_field_packet(sub + h*k3)
+                xy[active] = sub + h*(k1 + 2*k2 + 2*k3 + k4)/6
+            out[i] = xy
+            if negx.shape[0] > 0:
+                # freeze lines that have converged on a negative charge
+                dsq = ((xy[:, 0, None] - negx)**2 +
+                       (xy[:, 1, None] - negy)**2).min(axis=1)
+                active &= dsq > 0.1**2
+        return out
+
     def field_lines(self, nr_of_fieldlines=32, start_radius=0.2, lambda_max=10, points=801):
         ''' calculating the field lines which should include one at pi/4, rather than 0
 
@@ -171,20 +493,40 @@ class Charges:
                 the x and y values, respectively of the k-th fieldline
         '''
         
-        ang_scale = (2*np.pi)/nr_of_fieldlines
-        # Angles for the fieldlines
-        angles = np.linspace (ang_scale, 2*np.pi, nr_of_fieldlines) + np.pi/nr_of_fieldlines
+        dx, dy = self._start_offsets(nr_of_fieldlines, start_radius)
         # Points on fieldlines
         lambdas = np.linspace(0, lambda_max, points)
+        args = (nr_of_fieldlines, start_radius, lambda_max, points)
+        # indices of the positive charges, straight from the charge array
+        pos_idx = np.flatnonzero(self._q > 0)
+        missing = [int(k) for k in pos_idx if (int(k), args) not in self._fieldline_cache]
+        if missing:
+            # start points of all missing lines from one broadcast add
+            starts = np.stack((self._posx[missing][:, None] + dx[None, :],
+                               self._posy[missing][:, None] + dy[None, :]),
+                              axis=-1).reshape(-1, 2)
+            # Integrates e-field from 0 to lambda_max for all missing lines,
+            # adaptively so the steep field near the charges is resolved
+            qs = np.ascontiguousarray(self._q)
+            posx = np.ascontiguousarray(self._posx)
+            posy = np.ascontiguousarray(self._posy)
+            lines = np.empty((starts.shape[0], points, 2))
+
+            def trace(p):
+                rk45_fieldline(qs, posx, posy, starts[p], lambdas, lines[p],
+                               1e-6, 1e-9)
+
+            # the lines are independent and the kernel releases the GIL,
+            # so worker threads scale across cores without any copying
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor()
+            list(self._pool.map(trace, range(starts.shape[0])))
+            for j, k in enumerate(missing):
+                self._fieldline_cache[(k, args)] = [
+                    lines[j*nr_of_fieldlines + p] for p in range(nr_of_fieldlines)]
         fieldlines = []
-        for q, xy in self.get_charges():
-            if q > 0:
-                for i in angles:
-                    dx = start_radius*np.cos(i)
-                    dy = start_radius*np.sin(i) 
-                    # Integrates e-field from 0 to lambda_max in order to find each field line
-                    lines = odeint(self.scaled_electric_field, xy+(dx, dy), lambdas)
-                    fieldlines.append(lines)
+        for k in pos_idx:
+            fieldlines.extend(self._fieldline_cache[(int(k), args)])
         return fieldlines
         
     
@@ -227,6 +569,10 @@ class MyCentralWidget(QWidget):
 class MyMplWidget(FigureCanvas):
     ''' both a QWidget and a matplotlib figure '''
 
+    # reduced resolution used while a charge is being dragged; the full
+    # default resolution is restored by the replot on mouse release
+    drag_fieldline_args = (8, 0.2, 5, 150)
+
     def __init__(self, main_window, parent=None, figsize=(4, 4), dpi=100):
         self.main_window = main_window
         self.fig = plt.figure(figsize=figsize, dpi=dpi)
@@ -238,6 +584,7 @@ class MyMplWidget(FigureCanvas):
         self.qadd = 0
         self.lines = []
         self.points = []
+        self.background = None                  # static axes background for blitting
         self.field_lines_args = None            # used to save the parameters for use in drag_replt
         self.charges = Charges()
         # add some charges to start with an example
@@ -245,6 +592,13 @@ class MyMplWidget(FigureCanvas):
         self.charges.add_charge(1, (-1, 0))
         self.charges.add_charge(-1, (0, 1))
         self.charges.add_charge(-1, (0, -1))
+        # mouse-move events can arrive faster than frames can be drawn;
+        # drag positions are stashed and replotted at most once per 16ms
+        self.pending_drag_xy = None
+        self.replot_timer = QTimer(self)
+        self.replot_timer.setSingleShot(True)
+        self.replot_timer.setInterval(16)
+        self.replot_timer.timeout.connect(self.drag_replot)
         self.plot_fieldlines()
         FigureCanvas.setSizePolicy(self, QSizePolicy.Expanding, QSizePolicy.Expanding)
         FigureCanvas.updateGeometry(self)
@@ -263,36 +617,77 @@ class MyMplWidget(FigureCanvas):
         
         # Plots field lines
         for i in self.charges.field_lines(*self.field_lines_args):
-            field = self.ax.plot(i[:, 0], i[:, 1], 'k')
+            field, = self.ax.plot(i[:, 0], i[:, 1], 'k')
             self.lines.append(field)
-            # Plots charges
-            for charge in self.charges.get_charges():
-                if charge [0] > 0:
-                    point, = self.ax.plot(charge [1] [0], charge [1][1], 'o', c='r', ms=10*charge[0])
-                else:
-                    point, = self.ax.plot(charge [1] [0], charge [1] [1], 'o', c='b', ms=10*-charge[0])
-
+        # Plots charges, one marker per charge
+        for charge in self.charges.get_charges():
+            if charge[0] > 0:
+                point, = self.ax.plot(charge[1][0], charge[1][1], 'o', c='r', ms=10*charge[0])
+            else:
+                point, = self.ax.plot(charge[1][0], charge[1][1], 'o', c='b', ms=10*-charge[0])
             self.points.append(point)
-        
-      
+
         self.ax.set_xlabel('$x$')
         self.ax.set_ylabel('$y$')
         self.ax.set_xlim(-5, 5)
         self.ax.set_ylim(-5, 5)
         self.ax.set_aspect('equal')
+        # draw once with the dynamic artists hidden and keep the rendered
+        # background, so drag_replot can blit the artists on top of it
+        # without a full redraw
+        for artist in self.lines + self.points:
+            artist.set_visible(False)
         self.draw()
+        self.background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self.lines + self.points:
+            artist.set_visible(True)
+        self.blit_artists()
+
+    def blit_artists(self):
+        ''' restore the cached background and redraw only the dynamic artists '''
+        self.fig.canvas.restore_region(self.background)
+        for line in self.lines:
+            self.ax.draw_artist(line)
+        for point in self.points:
+            self.ax.draw_artist(point)
+        self.fig.canvas.blit(self.ax.bbox)
 
   
     def drag_replot(self):
-        ''' replot elements in self.lines and self.point
+        ''' replot elements in self.lines and self.points
             after adjusting their xdata and ydata arrays
             to reflect the new position of the dragged charge.
+
+            The artists are blitted onto the cached axes background, so a
+            drag frame never triggers a full figure redraw. The lines are
+            traced at the reduced drag resolution; unchanged ones come
+            straight out of the Charges cache.
         '''
-        self.ax.draw_artist(self.ax.patch)                              # <-- redraw the plotting area of the axis
-        
-        self.plot_fieldlines(nr_of_fieldlines = 8)
-        
-        self.fig.canvas.update()                                        # <-- update the figure
+        if self.closest_k is None:
+            # the drag ended before the coalescing timer fired
+            return
+        if self.pending_drag_xy is not None:
+            self.charges.set_position(self.closest_k, self.pending_drag_xy)
+            self.pending_drag_xy = None
+        fieldlines = self.charges.field_lines(*self.drag_fieldline_args)
+        if len(fieldlines) != len(self.lines):
+            # first drag frame (or number of lines changed): rebuild the
+            # artists at drag resolution
+            self.plot_fieldlines(*self.drag_fieldline_args)
+            return
+        for line, fieldline in zip(self.lines, fieldlines):
+            line.set_data(fieldline[:, 0], fieldline[:, 1])
+        # redraw the charge markers at their current positions
+        for point in self.points:
+            point.remove()
+        self.points = []
+        for charge in self.charges.get_charges():
+            if charge[0] > 0:
+                point, = self.ax.plot(charge[1][0], charge[1][1], 'o', c='r', ms=10*charge[0])
+            else:
+                point, = self.ax.plot(charge[1][0], charge[1][1], 'o', c='b', ms=10*-charge[0])
+            self.points.append(point)
+        self.blit_artists()
         self.fig.canvas.flush_events()                                  # <-- ensure all draw requests are sent out
 
   
@@ -305,12 +700,13 @@ class MyMplWidget(FigureCanvas):
             If a charge is being added then self.qadd, the value of the charge
             is updated and the current value displayed in the statusbar.
 
-            If a charge is being dragged then its position is updated in the
-            self.charges object and the charges and fieldlines are displayed using
-            drag_replot().
+            If a charge is being dragged then its new position is stashed
+            and a replot via drag_replot() is scheduled on the coalescing
+            timer, so bursts of move events cost at most one redraw per
+            timer interval.
 
         '''
-        
+
         # Checks cursor position is within boundary
         if event.xdata is not None and event.ydata is not None:
             # Reveals cursor coordinates
@@ -322,8 +718,9 @@ class MyMplWidget(FigureCanvas):
                 self.qadd = event.xdata - self.mouse_pressed_pos [0]
             else:
                 self.dragging = True
-                self.charges.set_position(self.closest_k, [event.xdata, event.ydata])
-                self.drag_replot()
+                self.pending_drag_xy = [event.xdata, event.ydata]
+                if not self.replot_timer.isActive():
+                    self.replot_timer.start()
 
         
     def on_mouse_press(self, event):
@@ -348,10 +745,15 @@ class MyMplWidget(FigureCanvas):
         and reset attributes as appropriate.
         '''
         
+        self.replot_timer.stop()
         if self.closest_k is None:
             self.charges.add_charge(round(self.qadd), self.mouse_pressed_pos)
         elif self.dragging is False:
             self.charges.delete_charge(self.closest_k)
+        elif self.pending_drag_xy is not None:
+            # apply the last drag position the timer did not get to
+            self.charges.set_position(self.closest_k, self.pending_drag_xy)
+            self.pending_drag_xy = None
         self.plot_fieldlines()
         # Resets changed attributes
         self.mouse_pressed_pos = None
@@ -20,7 +20,7 @@ def totaldays (months):
     -------
     totaldays : integer value of the total days in a given year.
     '''
-    return np.sum([x[1] for x in months.items()])
+    return sum(months.values())
 
 
 def matching (months, names):
@@ -49,22 +49,29 @@ def matching (months, names):
 '''
 
 
-    #first_character_name = [x[0] for x in names]
-    #first_character_month = [x[0] for x in months]
-    match_count = 0
-    no_match_count = 0
-    name_sum = []
-    #Nested loops to count the number of days matched or not matched
-    for i in names:
-        for j in months:
-            if i[0] == j [0]:
-                match_count += months[j]
-            else: no_match_count += months[j]
-    #Appends the number of days where each name doesn't match to a list so a product can be taken 
-        name_sum.append(no_match_count)
-        no_match_count = 0 
-    return (match_count/totaldays (months), np.prod (name_sum)/
-            (totaldays (months)**len(names))) 
+    # month names and day counts from a single pass over the dict
+    month_names, month_days = zip(*months.items())
+    # first-letter ordinals of the names and the months
+    initials_n = np.array([ord(n[0]) for n in names], dtype=np.int64)
+    initials_m = np.array([ord(m[0]) for m in month_names], dtype=np.int64)
+    days = np.array(month_days, dtype=np.int64)
+    # table of days per initial, so each name needs only a single lookup
+    # instead of a pass over all the months
+    size = int(max(initials_n.max(initial=0), initials_m.max(initial=0))) + 1
+    bucket = np.zeros(size, dtype=np.int64)
+    np.add.at(bucket, initials_m, days)
+    match_days = bucket[initials_n]
+    total = totaldays(months)
+    # days where each name doesn't match
+    name_sum = total - match_days
+    if np.any(name_sum == 0):
+        # some name matches every month, so no-match is impossible
+        prob_no_match = 0.0
+    else:
+        # product of the per-name probabilities taken in log-space, which
+        # neither overflows the numerator nor underflows for many names
+        prob_no_match = np.exp(np.sum(np.log(name_sum/total)))
+    return (match_days.sum()/total, prob_no_match)
 
 if __name__ == '__main__':
 
@@ -8,7 +8,6 @@ Comparing the amplitude and period of a pendulum
 '''
 
 import numpy as np
-from scipy import interpolate
 from scipy import integrate
 import matplotlib.pyplot as plt
 
@@ -45,7 +44,33 @@ class pendulum:
         
         # y[0] : (angular acceleration), y[1] : (angular velocity)
         return np.array([y[1], -(self._g/self._length)*np.sin(y[0])])
-        
+
+
+    def dydt_batch(self, y, t):
+        """ Calculating the derivatives for a batch of independent pendulums
+
+        The K pendulums are stacked into one flat state vector so a single
+        ODE solve advances all of them at once.
+
+        Parameters
+        ----------
+        y: array-like
+            flat vector of unknowns of shape (2K, ), angle and angular
+            velocity of pendulum k at y[2k] and y[2k+1]
+
+        t: float
+            time t
+
+        Returns
+        -------
+        ret: numpy array of float
+            the derivatives of y, flattened the same way
+        """
+
+        y = y.reshape(-1, 2)
+        return np.column_stack((y[:, 1],
+                                -(self._g/self._length)*np.sin(y[:, 0]))).ravel()
+
 
 
     def period(self, maximum_amplitude):
@@ -55,7 +80,9 @@ class pendulum:
         Otherwise the period is calculated by integrating the ODE using
         scipy.integrate.odeint() and determining the time between release at
         maximum amplitude and the first angle=0 crossing. The exact zero
-        crossing is determined using scipy.interpolate.interp1d().
+        crossing is determined from a local cubic fit of time against angle
+        around the crossing, instead of building a full interpolating
+        spline over all the samples.
 
         In the calculation it is assumed that the period has a value between
         90% and 150% of the small amplitude period.
@@ -79,11 +106,59 @@ class pendulum:
         else:
             t = np.linspace(0, 1.5*period_0/4, 75)
             solution = integrate.odeint(self.dydt, [maximum_amplitude, 0], t)
-            func = interpolate.interp1d(solution[:, 0], t, kind='cubic')
+            # first sample at or past the zero crossing
+            i = np.argmax(solution[:, 0] <= 0)
+            window = slice(max(i - 2, 0), i + 2)
+            # cubic fit of t as a function of angle through the window
+            fit = np.polyfit(solution[window, 0], t[window], 3)
             # period is 4x the time from maximum amplitude to 0
-            period = func(0) * 4
+            period = np.polyval(fit, 0.0) * 4
         return period
-        
+
+
+    def periods(self, maximum_amplitudes):
+        ''' Calculating the period for a whole array of maximum amplitudes.
+
+        All the pendulums are integrated together in one batched ODE solve
+        (see dydt_batch) instead of one odeint call per amplitude. The zero
+        crossing of each pendulum is then found from a local cubic fit of
+        time against angle around the crossing, like the cubic
+        interpolation used in period().
+
+        Parameters
+        ----------
+        maximum_amplitudes: array-like
+            maximum amplitudes of the periodic motion
+
+        Returns
+        -------
+        p: numpy array of float
+            the period for each amplitude
+        '''
+
+        amplitudes = np.asarray(maximum_amplitudes, dtype=float)
+        # small amplitude analytical solution
+        period_0 = 2*np.pi*np.sqrt(self._length/self._g)
+        t = np.linspace(0, 1.5*period_0/4, 75)
+        y0 = np.zeros((amplitudes.shape[0], 2))
+        y0[:, 0] = amplitudes
+        solution = integrate.odeint(self.dydt_batch, y0.ravel(), t)
+        # angle of pendulum k is in column 2k
+        theta = solution[:, 0::2]
+        periods = np.full(amplitudes.shape, period_0)
+        for k, amplitude in enumerate(amplitudes):
+            if amplitude == 0:
+                # small amplitude analytical solution
+                continue
+            # first sample at or past the zero crossing
+            i = np.argmax(theta[:, k] <= 0)
+            window = slice(max(i - 2, 0), i + 2)
+            # cubic fit of t as a function of angle through the window
+            fit = np.polyfit(theta[window, k], t[window], 3)
+            # period is 4x the time from maximum amplitude to 0
+            periods[k] = np.polyval(fit, 0.0) * 4
+        return periods
+
 
 if __name__ == '__main__':
     #some test code
@@ -92,7 +167,7 @@ if __name__ == '__main__':
 
     #generate data for figure
     angles = np.linspace(0, np.pi/2, 31)
-    period_ode = [pen.period(a) for a in angles]
+    period_ode = pen.periods(angles)
 
     # generate a plot
     fig = plt.figure()
@@ -24,6 +24,12 @@ class Jug_tests(unittest.TestCase):
         j.pour_in(32, 56)
         self.assertAlmostEqual(j.temperature(), 56)
 
+    def test_temp_empty(self):
+        ''' tests pour_in of zero volume into an empty jug'''
+        j = Jug(123)
+        j.pour_in(0, 20)
+        self.assertAlmostEqual(j.temperature(), 20)
+
     def test_wv(self):
         ''' tests pour_in water_volume()'''
         j = Jug(123)
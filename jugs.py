@@ -46,7 +46,14 @@ class Jug():
         '''Return capacity'''
         return self.max_capacity
     
-    def temp_change (self, temperature, volume): 
+    def temp_change (self, temperature, volume):
         '''Calculates temperature'''
-        return (self.temp * self.volume + temperature * 
-                volume) / (self.volume + volume)
\ No newline at end of file
+        # An empty jug takes the temperature of whatever is poured in;
+        # this also avoids dividing 0 by 0 when the poured volume is 0
+        if self.volume == 0:
+            return temperature
+        total = self.volume + volume
+        if total == 0:
+            return self.temp
+        return (self.temp * self.volume + temperature *
+                volume) / total
\ No newline at end of file